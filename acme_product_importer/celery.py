@@ -12,11 +12,36 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.conf.broker_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
 app.conf.result_backend = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
 
-# Accept JSON only
-app.conf.accept_content = ['json']
-app.conf.task_serializer = 'json'
+# msgpack for task payloads (large import batches encode faster and smaller than JSON),
+# JSON still accepted so messages already queued keep working
+app.conf.accept_content = ['msgpack', 'json']
+app.conf.task_serializer = 'msgpack'
 app.conf.result_serializer = 'json'
 
+# Reuse a bounded pool of broker connections/producers across publishes (views, webhook
+# fan-out) instead of connecting per .delay()
+app.conf.broker_pool_limit = 10
+# keep retrying the broker on startup instead of failing (explicit, the implicit default is deprecated)
+app.conf.broker_connection_retry_on_startup = True
+
+# Long process_batch tasks: fetch one message at a time so they don't starve others,
+# and keep unacked messages invisible long enough for a batch to finish
+app.conf.worker_prefetch_multiplier = 1
+app.conf.broker_transport_options = {'visibility_timeout': 3600}
+
+# Heavy import work gets its own queue so small latency-sensitive tasks (finalize, webhooks)
+# never wait behind it, see worker -Q options in docker-compose.yml
+app.conf.task_default_queue = 'default'
+app.conf.task_routes = {
+    'products.tasks.import_products_task': {'queue': 'imports'},
+    'products.tasks.process_batch': {'queue': 'imports'},
+    'products.tasks.finalize_import': {'queue': 'default'},
+    'products.tasks.fail_import': {'queue': 'default'},
+    'products.tasks.dispatch_webhooks_task': {'queue': 'webhooks'},
+    'products.tasks.trigger_webhook': {'queue': 'webhooks'},
+    'products.tasks.test_webhook_task': {'queue': 'webhooks'},
+}
+
 # Enable events for worker discovery / monitoring
 app.conf.worker_send_task_events = True
 app.conf.task_send_sent_event = True
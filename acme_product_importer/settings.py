@@ -84,8 +84,14 @@ WSGI_APPLICATION = 'acme_product_importer.wsgi.application'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
 
+# persistent connections are opt-in per process: celery workers set DB_CONN_MAX_AGE=600 so each
+# batch task doesn't reconnect to Postgres, the ASGI web process keeps 0 since it runs every
+# request's sync code in a new thread and would leave one open connection behind per request
 DATABASES = {
-    'default': dj_database_url.config(default=os.environ.get('DATABASE_URL', 'sqlite:///db.sqlite3'))
+    'default': dj_database_url.config(
+        default=os.environ.get('DATABASE_URL', 'sqlite:///db.sqlite3'),
+        conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', 0)),
+    )
 }
 
 # Password validation
@@ -141,6 +147,14 @@ MEDIA_URL = '/media/'
 REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
-CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['msgpack', 'json']
+CELERY_TASK_SERIALIZER = 'msgpack'
 CELERY_RESULT_SERIALIZER = 'json'
+
+# Shared cache (product_list pages, webhook lookups) so invalidation reaches web and worker processes
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+}
@@ -0,0 +1,44 @@
+import hashlib
+from django.core.cache import cache
+from .models import Webhook
+
+# product_list pages are cached for a short TTL under a version number that is bumped on
+# every product write, so edits show up immediately instead of after the TTL
+PRODUCT_LIST_TTL = 30
+PRODUCT_LIST_VERSION_KEY = 'plist:version'
+
+
+def product_list_key(q, active, page, after=''):
+    """
+    Build the cache key of one product_list page for the current product data version.
+    """
+    version = cache.get_or_set(PRODUCT_LIST_VERSION_KEY, 1, None)
+    params = hashlib.md5(f"{q}|{active}|{page}|{after}".encode()).hexdigest()
+    return f"plist:{version}:{params}"
+
+
+def invalidate_product_list():
+    """
+    Invalidate every cached product_list page by bumping the data version.
+    Call this after writes that bypass model signals (bulk upserts, raw deletes).
+    """
+    try:
+        cache.incr(PRODUCT_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(PRODUCT_LIST_VERSION_KEY, 1, None)
+
+
+# enabled webhook ids per event, read on every product write / import
+WEBHOOKS_TTL = 60
+
+
+def webhooks_key(event):
+    return f"hooks:{event}"
+
+
+def invalidate_webhooks():
+    """
+    Drop the cached webhook ids of every event. Runs from the Webhook post_save/post_delete
+    receivers, call it directly after queryset updates that change url/event_type/is_enabled.
+    """
+    cache.delete_many([webhooks_key(event) for event, _ in Webhook.EVENT_CHOICES])
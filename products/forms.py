@@ -11,6 +11,13 @@ class ProductForm(forms.ModelForm):
         model = Product
         fields = ['name','sku','description','active']
 
+    def clean_sku(self):
+        # sku_lower isn't a form field, so check case-insensitive uniqueness here instead of hitting the DB constraint
+        sku = self.cleaned_data['sku'].strip()
+        if Product.objects.filter(sku_lower=sku.lower()).exclude(pk=self.instance.pk).exists():
+            raise forms.ValidationError('Product with this SKU already exists.')
+        return sku
+
 # Form for webhooks
 class WebhookForm(forms.ModelForm):
     class Meta:
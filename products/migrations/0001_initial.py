@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-15 14:29
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('sku', models.CharField(max_length=255)),
+                ('sku_lower', models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('sku'), output_field=models.CharField(max_length=255), unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Webhook',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField()),
+                ('event_type', models.CharField(choices=[('product_imported', 'Product Imported'), ('product_created', 'Product Created'), ('product_updated', 'Product Updated')], max_length=50)),
+                ('is_enabled', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_tested_at', models.DateTimeField(blank=True, null=True)),
+                ('last_test_status', models.IntegerField(blank=True, null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# product_list filters with sku/name/description__icontains, which Django compiles to
+# UPPER(col::text) LIKE UPPER('%q%') on Postgres, so the trigram indexes are built on that
+# exact expression and can serve the ORed substring search instead of a sequential scan
+TRGM_INDEXES = {
+    'product_sku_trgm': 'sku',
+    'product_name_trgm': 'name',
+    'product_description_trgm': 'description',
+}
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('products', 'Product')._meta.db_table
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRGM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_product_trigram_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-updated_at', '-id'], name='product_updated_at_id_idx'),
+        ),
+    ]
@@ -1,19 +1,27 @@
 from django.db import models
-from django.db.models import UniqueConstraint
 from django.db.models.functions import Lower
 
 # Product class - currently only has minimal fields for cleaner testing, can increase fields later if needed
 class Product(models.Model):
     name = models.CharField(max_length=255)
-    sku = models.CharField(max_length=255, unique=True) # making this unique for bulk create upsert!
+    sku = models.CharField(max_length=255) # original casing from CSV / form
+    # stored lowercase copy of sku, its plain unique B-tree gives case-insensitive uniqueness
+    # and is the ON CONFLICT (sku_lower) target for bulk upserts!
+    sku_lower = models.GeneratedField(
+        expression=Lower('sku'),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+        unique=True,
+    )
     description = models.TextField(blank=True)
     active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        constraints = [
-            UniqueConstraint(Lower('sku'), name='unique_sku_ci')
+        indexes = [
+            # product_list order (newest first, id breaks ties within a bulk import) and its keyset cursor
+            models.Index(fields=['-updated_at', '-id'], name='product_updated_at_id_idx'),
         ]
 
     def __str__(self):
@@ -0,0 +1,67 @@
+import asyncio
+import redis
+import redis.asyncio
+from django.conf import settings
+
+# one bounded, keep-alive Redis connection pool per process, shared by views and tasks
+# (callers block up to 5s for a free connection instead of opening unbounded new ones)
+POOL_OPTIONS = dict(
+    max_connections=32,
+    timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+    retry_on_timeout=True,
+    decode_responses=True,
+)
+pool = redis.BlockingConnectionPool.from_url(settings.REDIS_URL, **POOL_OPTIONS)
+_async_clients = {}  # event loop -> (redis.asyncio client, pub/sub client), see _async_clients_for_loop
+
+
+def get_redis():
+    """
+    Return a Redis client on the shared pool.
+    Connections are acquired from and released back to the pool per command/pipeline.
+    """
+    return redis.Redis(connection_pool=pool)
+
+
+def _async_clients_for_loop():
+    """
+    Return the redis.asyncio clients of the running event loop.
+    asyncio connections can't outlive the loop they were opened on: under uvicorn there is one
+    loop per worker, but WSGI/runserver/test clients run each async view on a fresh loop,
+    so clients are kept per loop and dropped once their loop is closed.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.get(loop)
+    if clients is None:
+        for closed in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[closed]
+        clients = _async_clients[loop] = (
+            redis.asyncio.Redis(
+                connection_pool=redis.asyncio.BlockingConnectionPool.from_url(settings.REDIS_URL, **POOL_OPTIONS)
+            ),
+            # a subscription holds its connection for the whole job_stream, so pub/sub gets its own
+            # unbounded pool and open streams can never starve the bounded one used for commands
+            redis.asyncio.Redis(
+                connection_pool=redis.asyncio.ConnectionPool.from_url(
+                    settings.REDIS_URL, socket_keepalive=True, health_check_interval=30, decode_responses=True
+                )
+            ),
+        )
+    return clients
+
+
+def get_async_redis():
+    """
+    Return the redis.asyncio client of the running event loop, used by the async views for commands.
+    """
+    return _async_clients_for_loop()[0]
+
+
+def get_async_pubsub(**kwargs):
+    """
+    Return a redis.asyncio PubSub on the running loop's dedicated pub/sub pool.
+    Call reset() on it when done to give its connection back.
+    """
+    return _async_clients_for_loop()[1].pubsub(**kwargs)
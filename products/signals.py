@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import invalidate_product_list, invalidate_webhooks
+from .models import Product, Webhook
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def product_changed(sender, **kwargs):
+    """
+    Drop cached product_list pages whenever a product is saved or deleted through the ORM.
+    """
+    invalidate_product_list()
+
+
+@receiver(post_save, sender=Webhook)
+@receiver(post_delete, sender=Webhook)
+def webhook_changed(sender, **kwargs):
+    """
+    Drop the cached webhook ids whenever a webhook is saved or deleted, from the views or the admin.
+    """
+    invalidate_webhooks()
@@ -1,18 +1,90 @@
 import csv
+import itertools
+import math
 import os
-from datetime import datetime
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
 from celery import shared_task, group, chord
 from celery.exceptions import Retry
 from .models import Product, Webhook
-import redis
+from .redis_client import get_redis
+from .cache import WEBHOOKS_TTL, invalidate_product_list, webhooks_key
 
 logger = logging.getLogger(__name__)
-_r = redis.from_url(settings.REDIS_URL, decode_responses=True)
+_r = get_redis()
 
-CHUNK_SIZE = 1000  # number of rows per subtask (can increase it to 5000 for more speed but use more memory)
+JOB_TTL = 24 * 60 * 60  # job:{job_id} hashes expire a day after their last write (keeps retry possible)
+
+# one round-trip per batch: bump the processed counter and, if the throttle lock is free,
+# compute progress % server-side and write progress + message
+# KEYS: job hash, progress_lock / ARGV: batch count, total rows, throttle ms
+_progress_script = _r.register_script("""
+local processed = redis.call('HINCRBY', KEYS[1], 'processed', ARGV[1])
+if redis.call('SET', KEYS[2], 1, 'NX', 'PX', ARGV[3]) then
+    redis.call('HSET', KEYS[1],
+        'progress', math.floor(processed * 100 / ARGV[2]),
+        'message', 'Processed ' .. processed .. '/' .. ARGV[2])
+    redis.call('PUBLISH', KEYS[3], 'progress')
+end
+return processed
+""")
+
+# shared HTTP session so webhook POSTs reuse keep-alive connections (and TLS) per host
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+TASK_CHUNK_SIZE = 20_000  # number of rows per process_batch subtask (one chunk file / celery message each)
+# rows per INSERT for the bulk_create fallback, each row binds one param per inserted column (sku, name,
+# description, active, created_at, updated_at; sku_lower is generated), keep statements under 60k params
+DB_BATCH_SIZE = 60_000 // sum(1 for f in Product._meta.concrete_fields if not f.primary_key and not f.generated)
+PROGRESS_THROTTLE_MS = 200  # min gap between progress writes per job (UI polls at ~1 Hz)
+CSV_BLOCK_SIZE = 8 << 20  # 8 MiB blocks for the Arrow CSV reader
+STREAMING_THRESHOLD = 50 * 1024 * 1024  # files above 50 MiB are read block by block and deduped as they stream
+IMPORT_COLUMNS = ['sku', 'name', 'description']
+# batches are spilled here as headerless CSV and only their paths go through the broker,
+# MEDIA_ROOT is the volume shared between web and worker containers
+CHUNKS_DIR = os.path.join(settings.MEDIA_ROOT or 'media', 'chunks')
+
+# Postgres fast path: COPY each batch into a temp staging table, then upsert from it in one statement
+STAGE_TABLE = f"{Product._meta.db_table}_stage"
+CREATE_STAGE_SQL = (
+    f"CREATE TEMP TABLE {STAGE_TABLE} "
+    f"(sku varchar(255), name varchar(255), description text) ON COMMIT DROP"
+)
+COPY_BUFFER_SIZE = 1 << 20  # 1 MiB reads when streaming a chunk file into COPY
+COPY_STAGE_SQL = f"COPY {STAGE_TABLE} (sku, name, description) FROM STDIN WITH CSV"
+UPSERT_FROM_STAGE_SQL = (
+    f"INSERT INTO {Product._meta.db_table} (sku, name, description, active, created_at, updated_at) "
+    f"SELECT sku, name, description, TRUE, now(), now() FROM {STAGE_TABLE} "
+    f"ON CONFLICT (sku_lower) DO UPDATE SET "
+    f"sku = EXCLUDED.sku, name = EXCLUDED.name, description = EXCLUDED.description, "
+    f"updated_at = EXCLUDED.updated_at"
+)
+
+
+def _update_job(job_id, **fields):
+    """
+    Write fields into the job:{job_id} hash polled by the UI, refresh its TTL and notify
+    job_stream subscribers on job:{job_id}:events, in one round-trip.
+
+    :param job_id: job ID for progress tracking in Redis
+    :param fields: hash fields to set (status, progress, message, ...)
+    """
+    with _r.pipeline(transaction=False) as p:
+        p.hset(f"job:{job_id}", mapping=fields)
+        p.expire(f"job:{job_id}", JOB_TTL)
+        p.publish(f"job:{job_id}:events", fields.get('status', 'update'))
+        p.execute()
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=10)
@@ -26,67 +98,45 @@ def import_products_task(self, filepath, job_id):
     :returns: JSON response of accepted/failed with error
     """
     try:
-        _r.set(f"job:{job_id}:status", "parsing")
-        _r.set(f"job:{job_id}:progress", 0)
-        _r.set(f"job:{job_id}:message", "Parsing CSV")
+        _update_job(job_id, status="parsing", progress=0, message="Parsing CSV")
         logger.info(f"Job {job_id}: started parsing CSV {filepath}")
 
         # --- GLOBAL DEDUPE: keep last occurrence of each SKU (case-insensitive) ---
-        unique_map = {}  # sku_lower -> row dict (last seen wins!)
-        with open(filepath, newline='', encoding='utf-8', errors='ignore') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                sku_raw = (row.get('sku') or row.get('SKU') or row.get('Sku') or '').strip()
-                if not sku_raw:
-                    continue
-                sku = sku_raw.lower()
-                if sku == 'sku':  # skip header-like rows
-                    continue
-                unique_map[sku] = {
-                    'sku': sku,  # normalized to lowercase for DB unique index
-                    'name': (row.get('name') or row.get('Name') or '').strip(),
-                    'description': (row.get('description') or row.get('Description') or '').strip(),
-                }
-
-        unique_rows = list(unique_map.values())
-        total_rows = len(unique_rows)
+        # parsing, normalizing and dedupe all run as vectorized Arrow kernels, no per-row python loop
+        table, rows_read = _read_unique_products(filepath)
+        total_rows = table.num_rows
+        logger.info(f"Job {job_id}: parsed {rows_read} rows, {total_rows} unique SKUs")
 
         if total_rows <= 0:
-            _r.set(f"job:{job_id}:status", "failed")
-            _r.set(f"job:{job_id}:message", "Empty file or invalid")
+            _update_job(job_id, status="failed", message="Empty file or invalid")
             logger.warning(f"Job {job_id}: CSV empty or invalid")
             return {'error': 'empty'}
 
         # init progress in redis for polling
-        _r.set(f"job:{job_id}:status", "processing")
-        _r.set(f"job:{job_id}:progress", 0)
-        _r.set(f"job:{job_id}:message", "Starting import")
-        _r.set(f"job:{job_id}:processed", 0)
-        _r.set(f"job:{job_id}:total", total_rows)
-
-        # --- CHUNKING ---
-        chunks = []
-        batch = []
-        for r in unique_rows:
-            batch.append(r)
-            if len(batch) >= CHUNK_SIZE:
-                chunks.append(batch)
-                batch = []
-        if batch:
-            chunks.append(batch)
+        _update_job(
+            job_id,
+            status="processing",
+            progress=0,
+            message="Starting import",
+            processed=0,
+            total=total_rows,
+        )
 
         # dispatch tasks in parallel and finalize
         # actual celery async processing happens using below chord!
-        header = group(process_batch.s(chunk, job_id, total_rows) for chunk in chunks)
-        callback = finalize_import.s(job_id)
+        header = group(
+            process_batch.s(chunk_path, job_id, total_rows)
+            for chunk_path in _spill_batches(table, _chunk_dir(job_id))
+        )
+        # finalize only runs if every batch succeeds, on_error cleans up after a batch that ran out of retries
+        callback = finalize_import.s(job_id).on_error(fail_import.s(job_id))
         chord(header)(callback)
 
-        logger.info(f"Job {job_id}: dispatched {len(chunks)} chunks for processing")
+        logger.info(f"Job {job_id}: dispatched {math.ceil(total_rows / TASK_CHUNK_SIZE)} chunks for processing")
         return {'ok': True}
 
     except Exception as exc:
-        _r.set(f"job:{job_id}:status", "failed")
-        _r.set(f"job:{job_id}:message", str(exc))
+        _update_job(job_id, status="failed", message=str(exc))
         logger.exception(f"Job {job_id} failed during import")
         try:
             # using exponential backoff, not using DLQ's as of now but can do it later!
@@ -96,48 +146,225 @@ def import_products_task(self, filepath, job_id):
         return {'error': str(exc)}
 
 
+def _read_unique_products(filepath):
+    """
+    Read the CSV with Arrow, then normalize and dedupe it with Arrow compute kernels.
+
+    - Headers are matched case-insensitively, every column is read as a string.
+    - SKU, name and description are trimmed, SKU keeps its original casing.
+    - Empty and header-like SKUs are dropped.
+    - Duplicate SKUs (case-insensitive) collapse to their last occurrence, casing included.
+    - Files above STREAMING_THRESHOLD are streamed block by block and deduped after every
+      block, so memory stays O(unique SKUs) instead of O(file).
+    - Files Arrow's strict reader rejects (rows with missing/extra fields, invalid UTF-8) are
+      re-read with the lenient csv module reader, so they import exactly as they always did.
+
+    :param filepath: CSV filepath to read
+    :returns: tuple of (Arrow table with sku_lower/sku/name/description columns, number of rows read)
+    """
+    with open(filepath, newline='', encoding='utf-8', errors='ignore') as csvfile:
+        header = [h.strip().lower() for h in next(csv.reader(csvfile), [])]
+    if not header:
+        return _empty_products(), 0
+
+    csv_options = {
+        'read_options': pv.ReadOptions(block_size=CSV_BLOCK_SIZE, column_names=header, skip_rows=1),
+        'parse_options': pv.ParseOptions(newlines_in_values=True),  # quoted descriptions may span lines
+        'convert_options': pv.ConvertOptions(
+            column_types={col: pa.string() for col in IMPORT_COLUMNS},
+            include_columns=IMPORT_COLUMNS,
+            include_missing_columns=True,  # missing name/description read as nulls
+        ),
+    }
+
+    try:
+        if os.path.getsize(filepath) <= STREAMING_THRESHOLD:
+            table = pv.read_csv(filepath, **csv_options)
+            return _dedupe_products(_normalize_products(table)), table.num_rows
+        return _dedupe_blocks(pa.Table.from_batches([block]) for block in pv.open_csv(filepath, **csv_options))
+    except pa.ArrowInvalid as exc:
+        logger.warning(f"{filepath}: strict CSV read failed ({exc}), re-reading it with the csv module")
+        return _dedupe_blocks(_read_csv_lenient(filepath, header))
+
+
+def _read_csv_lenient(filepath, header):
+    """
+    Read the CSV with the csv module the way the importer always has: undecodable bytes are
+    dropped, short rows get empty trailing fields and extra fields are ignored.
+
+    :param filepath: CSV filepath to read
+    :param header: lowercased header row
+    :returns: generator of Arrow tables of up to TASK_CHUNK_SIZE rows with sku/name/description columns
+    """
+    positions = {col: header.index(col) for col in IMPORT_COLUMNS if col in header}
+    with open(filepath, newline='', encoding='utf-8', errors='ignore') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader, None)
+        while True:
+            rows = [row for row in itertools.islice(reader, TASK_CHUNK_SIZE) if row]
+            if not rows:
+                return
+            yield pa.table({
+                col: pa.array(
+                    [row[positions[col]] if col in positions and positions[col] < len(row) else None for row in rows],
+                    pa.string(),
+                )
+                for col in IMPORT_COLUMNS
+            })
+
+
+def _dedupe_blocks(blocks):
+    """
+    Normalize and dedupe a stream of Arrow tables incrementally.
+
+    :param blocks: iterable of Arrow tables with sku/name/description columns, in file order
+    :returns: tuple of (Arrow table with sku_lower/sku/name/description columns, number of rows read)
+    """
+    rows_read = 0
+    unique = None
+    for block in blocks:
+        rows_read += block.num_rows
+        block = _normalize_products(block)
+        # running unique rows come first, so rows from the newer block win on duplicates
+        unique = _dedupe_products(block if unique is None else pa.concat_tables([unique, block]))
+    if unique is None:
+        return _empty_products(), rows_read
+    return unique, rows_read
+
+
+def _empty_products():
+    return pa.table({col: pa.array([], pa.string()) for col in ['sku_lower'] + IMPORT_COLUMNS})
+
+
+def _normalize_products(table):
+    """
+    Trim sku/name/description, add the lowercased sku_lower dedupe key and drop
+    empty or header-like SKUs.
+
+    :param table: Arrow table with (possibly null) sku/name/description string columns
+    :returns: Arrow table with sku_lower/sku/name/description columns
+    """
+    sku = pc.utf8_trim_whitespace(pc.fill_null(table['sku'], ''))
+    sku_lower = pc.utf8_lower(sku)
+    table = pa.table({
+        'sku_lower': sku_lower,
+        'sku': sku,
+        'name': pc.utf8_trim_whitespace(pc.fill_null(table['name'], '')),
+        'description': pc.utf8_trim_whitespace(pc.fill_null(table['description'], '')),
+    })
+    return table.filter(pc.invert(pc.is_in(sku_lower, value_set=pa.array(['', 'sku']))))  # skip header-like rows
+
+
+def _dedupe_products(table):
+    """
+    Collapse rows sharing a sku_lower to their last occurrence.
+
+    :param table: Arrow table with sku_lower/sku/name/description columns
+    :returns: Arrow table with one row per sku_lower
+    """
+    # ordered 'last' aggregation needs a single-threaded group by
+    table = table.group_by('sku_lower', use_threads=False).aggregate([(col, 'last') for col in IMPORT_COLUMNS])
+    return table.select(['sku_lower'] + [f"{col}_last" for col in IMPORT_COLUMNS]).rename_columns(
+        ['sku_lower'] + IMPORT_COLUMNS
+    )
+
+
+def _chunk_dir(job_id):
+    return os.path.join(CHUNKS_DIR, job_id)
+
+
+def _spill_batches(table, chunk_dir):
+    """
+    Write TASK_CHUNK_SIZE slices of the deduped table to disk as headerless CSV files.
+
+    :param table: Arrow table with sku_lower/sku/name/description columns
+    :param chunk_dir: directory to write the chunk files into
+    :returns: generator of chunk file paths
+    """
+    os.makedirs(chunk_dir, exist_ok=True)
+    for i, offset in enumerate(range(0, table.num_rows, TASK_CHUNK_SIZE)):
+        chunk_path = os.path.join(chunk_dir, f"chunk_{i}.csv")
+        chunk = table.slice(offset, TASK_CHUNK_SIZE).select(IMPORT_COLUMNS)
+        pv.write_csv(chunk, chunk_path, pv.WriteOptions(include_header=False))
+        yield chunk_path
+
+
 @shared_task(bind=True, max_retries=3, default_retry_delay=5)
-def process_batch(self, batch, job_id, total_rows):
+def process_batch(self, chunk_path, job_id, total_rows):
     """
     Subtask: process a batch of products.
 
     - Each batch contains globally unique products (deduped by SKU).
-    - Performs bulk_create with update_conflicts=True (Postgres ON CONFLICT DO UPDATE).
-    - Updates Redis with progress and status message.
+    - On Postgres, streams the chunk file through COPY into a temp staging table and upserts it
+      with a single INSERT ... SELECT ... ON CONFLICT (sku_lower) DO UPDATE (rows never become python objects).
+    - On other backends, falls back to bulk_create with update_conflicts=True.
+    - Updates Redis with progress and status message (at most once per PROGRESS_THROTTLE_MS per job).
+    - Removes the chunk file once the batch is committed.
 
-    :param batch: list of dicts, each dict representing a product with 'sku', 'name', 'description'
+    :param chunk_path: path of a headerless sku,name,description CSV chunk
     :param job_id: job ID for progress tracking in Redis
     :param total_rows: total number of products for calculating progress %
     :returns: number of products processed
     """
     try:
-        curr_products = [
-            Product(sku=r['sku'], name=r['name'], description=r['description'])
-            for r in batch
-        ]
-
-        Product.objects.bulk_create(
-            curr_products,
-            update_conflicts=True,  # ON CONFLICT DO UPDATE
-            update_fields=['name', 'description'],
-            unique_fields=['sku'],
-            batch_size=1000
-        )
+        with transaction.atomic(), open(chunk_path, newline='', encoding='utf-8') as chunk:
+            if connection.vendor == 'postgresql':
+                count = _copy_upsert(chunk)
+            else:
+                # other backends (sqlite for local dev) fall back to the ORM upsert
+                products = [
+                    Product(sku=sku, name=name, description=description)
+                    for sku, name, description in csv.reader(chunk)
+                ]
+                Product.objects.bulk_create(
+                    products,
+                    update_conflicts=True,  # ON CONFLICT DO UPDATE
+                    update_fields=['sku', 'name', 'description', 'updated_at'],  # same columns as the COPY upsert
+                    unique_fields=['sku_lower'],
+                    batch_size=DB_BATCH_SIZE
+                )
+                count = len(products)
 
-        processed = _r.incrby(f"job:{job_id}:processed", len(curr_products))
-        _r.set(f"job:{job_id}:progress", int(processed * 100 / total_rows))
-        _r.set(f"job:{job_id}:message", f"Processed {processed}/{total_rows}")
-        logger.info(f"Job {job_id}: processed batch of {len(curr_products)} products")
-        return len(curr_products)
+        # processed counter is always incremented, it's the source of truth for finalize_import,
+        # progress + message (and the job_stream notification) are throttled across workers
+        # with a short-lived lock
+        _progress_script(
+            keys=[f"job:{job_id}", f"job:{job_id}:progress_lock", f"job:{job_id}:events"],
+            args=[count, total_rows, PROGRESS_THROTTLE_MS],
+        )
+        os.remove(chunk_path)
+        logger.info(f"Job {job_id}: processed batch of {count} products")
+        return count
 
     except Exception as exc:
         logger.exception(f"Job {job_id}: failed processing batch")
-        try:
-            # using exponential backoff, not using DLQ's as of now but can do it later!
-            self.retry(exc=exc, countdown=2 ** self.request.retries)
-        except Retry:
+        if self.request.retries >= self.max_retries:
             logger.error(f"Job {job_id}: batch exceeded max retries")
-        raise
+        # using exponential backoff, not using DLQ's as of now but can do it later!
+        # Retry ends this attempt in RETRY state, so the chord doesn't count it. Only once retries
+        # are exhausted does retry() re-raise exc, failing the batch and running fail_import.
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+def _copy_upsert(chunk):
+    """
+    Upsert a batch into Postgres via COPY FROM STDIN into a temp table + INSERT ... ON CONFLICT.
+    Must be called inside a transaction, the staging table is dropped on commit.
+
+    :param chunk: open file with headerless sku,name,description CSV rows
+    :returns: number of rows upserted
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_STAGE_SQL)
+        if hasattr(cursor, 'copy_expert'):  # psycopg2
+            # positional size: Django's DEBUG CursorDebugWrapper.copy_expert(sql, file, *args) takes no kwargs
+            cursor.copy_expert(COPY_STAGE_SQL, chunk, COPY_BUFFER_SIZE)
+        else:  # psycopg 3 (picked by Django when installed) has its own COPY API
+            with cursor.copy(COPY_STAGE_SQL) as copy:
+                while data := chunk.read(COPY_BUFFER_SIZE):
+                    copy.write(data)
+        cursor.execute(UPSERT_FROM_STAGE_SQL)
+        return cursor.rowcount
 
 
 @shared_task(bind=True)
@@ -147,6 +374,7 @@ def finalize_import(self, results, job_id):
 
     - Aggregates total processed count from subtasks.
     - Marks job as complete in Redis.
+    - Removes the job's spilled chunk directory.
     - Triggers any product_imported webhooks.
 
     :param results: list of processed counts returned by each subtask
@@ -155,33 +383,111 @@ def finalize_import(self, results, job_id):
     """
     try:
         total_processed = sum(results)
-        _r.set(f"job:{job_id}:status", "complete")
-        _r.set(f"job:{job_id}:progress", 100)
-        _r.set(f"job:{job_id}:message", f"Import complete ({total_processed} products)")
+        _update_job(
+            job_id,
+            status="complete",
+            progress=100,
+            message=f"Import complete ({total_processed} products)",
+        )
         logger.info(f"Job {job_id}: import complete ({total_processed} products)")
+        shutil.rmtree(_chunk_dir(job_id), ignore_errors=True)
+        invalidate_product_list()  # bulk upserts don't send post_save
         _trigger_webhooks('product_imported', {'total_imported': total_processed})
         return total_processed
     except Exception as e:
         logger.exception(f"Job {job_id}: finalize import failed")
-        _r.set(f"job:{job_id}:status", "failed")
-        _r.set(f"job:{job_id}:message", str(e))
+        _update_job(job_id, status="failed", message=str(e))
         return {'error': str(e)}
 
 
+@shared_task
+def fail_import(request, exc, traceback, job_id):
+    """
+    Error callback of the import chord, runs instead of finalize_import when a batch fails for good.
+
+    - Marks job as failed in Redis.
+    - Removes the job's spilled chunk directory.
+
+    :param request: request of the failed task
+    :param exc: exception raised by the failed task
+    :param traceback: traceback of the failure
+    :param job_id: job ID for progress tracking in Redis
+    """
+    logger.error(f"Job {job_id}: a batch failed, aborting import: {exc}")
+    _update_job(job_id, status="failed", message=f"Import failed: {exc}")
+    shutil.rmtree(_chunk_dir(job_id), ignore_errors=True)
+    invalidate_product_list()  # batches that did commit changed the table
+
+
+def get_hooks_for(event):
+    """
+    Return the ids of the enabled webhooks subscribed to an event, cached for WEBHOOKS_TTL
+    seconds (the webhook views invalidate it on every change).
+
+    :param event: event type (string)
+    :returns: list of webhook ids
+    """
+    return cache.get_or_set(
+        webhooks_key(event),
+        lambda: list(Webhook.objects.filter(event_type=event, is_enabled=True).values_list('id', flat=True)),
+        WEBHOOKS_TTL,
+    )
+
+
 def _trigger_webhooks(event, payload):
     """
-    Send HTTP POST requests to all enabled webhooks for the given event.
+    Fan out the given event to all enabled webhooks, one trigger_webhook task per hook
+    dispatched as a group so hooks are posted in parallel and retried independently.
+
+    :param event: event type (string)
+    :param payload: dict with event payload
+    """
+    hook_ids = get_hooks_for(event)
+    if hook_ids:
+        # one apply_async for the whole group, publishing through a pooled broker producer
+        group(trigger_webhook.s(hook_id, event, payload) for hook_id in hook_ids).apply_async()
+
+
+@shared_task(bind=True)
+def dispatch_webhooks_task(self, event, payload):
+    """
+    Task to look up the webhooks subscribed to an event and fan it out to them,
+    so views only pay for a single publish instead of the Webhook query + group publish.
 
     :param event: event type (string)
     :param payload: dict with event payload
     """
-    hooks = Webhook.objects.filter(event_type=event, is_enabled=True)
-    for h in hooks:
+    _trigger_webhooks(event, payload)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5)
+def trigger_webhook(self, hook_id, event, payload):
+    """
+    Task to send an event to a single webhook.
+
+    - Skips the hook if it was deleted or disabled after dispatch.
+    - Sends an HTTP POST with the event payload through the shared session.
+
+    :param hook_id: ID of the webhook to call
+    :param event: event type (string)
+    :param payload: dict with event payload
+    :returns: dict with HTTP status code or error
+    """
+    try:
+        url = Webhook.objects.filter(pk=hook_id, is_enabled=True).values_list('url', flat=True).first()
+        if url is None:
+            return {'error': 'webhook not found or disabled'}
+        resp = _session.post(url, json={'event': event, 'payload': payload}, timeout=5)
+        logger.info(f"Webhook triggered: {url} status={resp.status_code}")
+        return {'status': resp.status_code}
+    except Exception as exc:
+        logger.error(f"Webhook failed: {hook_id} error={str(exc)}")
         try:
-            resp = requests.post(h.url, json={'event': event, 'payload': payload}, timeout=5)
-            logger.info(f"Webhook triggered: {h.url} status={resp.status_code}")
-        except Exception as e:
-            logger.error(f"Webhook failed: {h.url} error={str(e)}")
+            # using exponential backoff, not using DLQ's as of now but can do it later!
+            self.retry(exc=exc, countdown=2 ** self.request.retries)
+        except Retry:
+            logger.error(f"Webhook retry exceeded: {hook_id}")
+        return {'error': str(exc)}
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=5)
@@ -190,18 +496,20 @@ def test_webhook_task(self, hook_id):
     Task to test a webhook endpoint.
 
     - Sends a test payload to the webhook URL.
-    - Updates Webhook model with last_test_status and last_tested_at.
+    - Updates last_test_status and last_tested_at with a targeted UPDATE (no full-row save).
 
     :param hook_id: ID of the webhook to test
     :returns: dict with HTTP status code or error
     """
     try:
-        hook = Webhook.objects.get(id=hook_id)
-        resp = requests.post(hook.url, json={'test': True}, timeout=10)
-        hook.last_test_status = resp.status_code
-        hook.last_tested_at = datetime.utcnow()
-        hook.save()
-        logger.info(f"Webhook test success: {hook.url} status={resp.status_code}")
+        # one single-column SELECT and one two-column UPDATE, no model instance round-trip
+        url = Webhook.objects.values_list('url', flat=True).get(pk=hook_id)
+        resp = _session.post(url, json={'test': True}, timeout=10)
+        Webhook.objects.filter(pk=hook_id).update(
+            last_test_status=resp.status_code,
+            last_tested_at=timezone.now(),
+        )
+        logger.info(f"Webhook test success: {url} status={resp.status_code}")
         return {'status': resp.status_code}
     except Exception as exc:
         logger.exception(f"Webhook test failed: {hook_id}")
@@ -1,3 +1,277 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+from datetime import timezone as dt_timezone
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.db import OperationalError
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from . import tasks, views
+from .cache import invalidate_product_list, product_list_key
+from .models import Product
+from .views import _parse_cursor
 
-# Create your tests here.
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class ReadUniqueProductsTests(SimpleTestCase):
+    """
+    _read_unique_products: Arrow fast path, streaming path and the lenient csv module fallback.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def write_csv(self, data):
+        path = os.path.join(self.tmpdir, 'products.csv')
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def read(self, data):
+        table, rows_read = tasks._read_unique_products(self.write_csv(data))
+        return {row['sku_lower']: row for row in table.to_pylist()}, rows_read
+
+    def test_multiline_quoted_values_across_blocks(self):
+        data = b'sku,name,description\n' + b''.join(b'S%d,Name,"multi\nline"\n' % i for i in range(2000))
+        for threshold in (tasks.STREAMING_THRESHOLD, 0):  # read_csv and open_csv paths
+            with self.subTest(streaming=threshold == 0), \
+                    mock.patch.object(tasks, 'CSV_BLOCK_SIZE', 4096), \
+                    mock.patch.object(tasks, 'STREAMING_THRESHOLD', threshold):
+                products, rows_read = self.read(data)
+                self.assertEqual(rows_read, 2000)
+                self.assertEqual(len(products), 2000)
+                self.assertEqual(products['s1999']['description'], 'multi\nline')
+
+    def test_invalid_utf8_bytes_are_dropped(self):
+        products, _ = self.read(b'sku,name,description\nA1,Appl\xff,x\nB2,Banana,y\n')
+        self.assertEqual(products['a1']['name'], 'Appl')
+        self.assertEqual(products['b2']['name'], 'Banana')
+
+    def test_short_and_long_rows_are_kept(self):
+        products, rows_read = self.read(b'sku,name,description\nA1,Apple\nB2,Banana,y,extra\n')
+        self.assertEqual(rows_read, 2)
+        self.assertEqual(products['a1'], {'sku_lower': 'a1', 'sku': 'A1', 'name': 'Apple', 'description': ''})
+        self.assertEqual(products['b2']['description'], 'y')
+
+    def test_duplicate_skus_last_occurrence_wins_case_insensitively(self):
+        data = b'SKU,Name,Description\n abc ,First,one\nXYZ,Other,two\nAbC,Last,three\n,Blank,x\nsku,Header,x\n'
+        for threshold in (tasks.STREAMING_THRESHOLD, 0):
+            with self.subTest(streaming=threshold == 0), mock.patch.object(tasks, 'STREAMING_THRESHOLD', threshold):
+                products, rows_read = self.read(data)
+                self.assertEqual(rows_read, 5)
+                self.assertEqual(sorted(products), ['abc', 'xyz'])
+                self.assertEqual(products['abc'], {'sku_lower': 'abc', 'sku': 'AbC', 'name': 'Last', 'description': 'three'})
+
+    def test_empty_file(self):
+        products, rows_read = self.read(b'')
+        self.assertEqual((products, rows_read), ({}, 0))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ProcessBatchTests(TestCase):
+    """
+    process_batch on the bulk_create upsert fallback (sqlite).
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        patcher = mock.patch.object(tasks, '_progress_script')
+        self.progress_script = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def spill(self, data):
+        path = os.path.join(self.tmpdir, 'products.csv')
+        with open(path, 'wb') as f:
+            f.write(data)
+        table, _ = tasks._read_unique_products(path)
+        return list(tasks._spill_batches(table, os.path.join(self.tmpdir, 'chunks')))
+
+    def test_upserts_chunk_on_sku_lower_and_removes_it(self):
+        Product.objects.create(sku='abc', name='Old', description='old', active=False)
+        [chunk_path] = self.spill(b'sku,name,description\nABC,New,"multi\nline"\nX1,Other,\n')
+
+        self.assertEqual(tasks.process_batch(chunk_path, 'job1', 2), 2)
+
+        self.assertEqual(Product.objects.count(), 2)
+        product = Product.objects.get(sku_lower='abc')
+        self.assertEqual((product.sku, product.name, product.description), ('ABC', 'New', 'multi\nline'))
+        self.assertFalse(product.active)  # not an imported column, left untouched
+        self.assertFalse(os.path.exists(chunk_path))
+        self.progress_script.assert_called_once_with(
+            keys=['job:job1', 'job:job1:progress_lock', 'job:job1:events'],
+            args=[2, 2, tasks.PROGRESS_THROTTLE_MS],
+        )
+
+    def test_failed_attempt_is_retried_without_failing_the_batch(self):
+        [chunk_path] = self.spill(b'sku,name,description\nABC,New,d\n')
+        bulk_create = Product.objects.bulk_create
+        attempts = []
+
+        def flaky_bulk_create(*args, **kwargs):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OperationalError('database is locked')
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(Product.objects, 'bulk_create', side_effect=flaky_bulk_create):
+            result = tasks.process_batch.apply(args=(chunk_path, 'job1', 1))
+
+        # eager apply runs the retry inline and reports its outcome
+        self.assertEqual((result.state, result.result), ('SUCCESS', 1))
+        self.assertEqual(len(attempts), 2)
+        self.assertTrue(Product.objects.filter(sku_lower='abc').exists())
+        self.assertFalse(os.path.exists(chunk_path))
+
+    def test_batch_fails_once_retries_are_exhausted(self):
+        [chunk_path] = self.spill(b'sku,name,description\nABC,New,d\n')
+        with mock.patch.object(Product.objects, 'bulk_create', side_effect=OperationalError('down')) as bulk_create:
+            result = tasks.process_batch.apply(args=(chunk_path, 'job1', 1))
+
+        self.assertEqual(result.state, 'FAILURE')
+        self.assertIsInstance(result.result, OperationalError)
+        self.assertEqual(bulk_create.call_count, tasks.process_batch.max_retries + 1)
+        self.assertTrue(os.path.exists(chunk_path))
+
+
+class DebugCopyCursor:
+    """
+    Stand-in for Django's psycopg2 CursorDebugWrapper (used when DEBUG=True): copy_expert takes no kwargs.
+    """
+
+    def __init__(self):
+        self.executed = []
+        self.copied = None
+        self.rowcount = 2
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+    def copy_expert(self, sql, file, *args):
+        self.copied = (sql, file.read(), args)
+
+
+class CopyUpsertTests(SimpleTestCase):
+
+    def test_copy_expert_called_positionally(self):
+        cursor = DebugCopyCursor()
+        chunk = io.StringIO('ABC,New,d\nX1,Other,\n')
+        with mock.patch.object(tasks, 'connection', mock.Mock(cursor=mock.Mock(return_value=cursor))):
+            self.assertEqual(tasks._copy_upsert(chunk), 2)
+        self.assertEqual(cursor.copied, (tasks.COPY_STAGE_SQL, 'ABC,New,d\nX1,Other,\n', (tasks.COPY_BUFFER_SIZE,)))
+        self.assertEqual(cursor.executed, [tasks.CREATE_STAGE_SQL, tasks.UPSERT_FROM_STAGE_SQL])
+
+
+class StoreUploadTests(SimpleTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        patcher = mock.patch.object(views, 'UPLOAD_DIR', self.tmpdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def temporary_upload(self, data):
+        f = TemporaryUploadedFile('products.csv', 'text/csv', len(data), None)
+        f.write(data)
+        f.seek(0)
+        self.addCleanup(f.close)
+        return f
+
+    def test_uploads_are_stored_once_by_content(self):
+        data = b'sku,name\nA1,Apple\n'
+        for n, f in enumerate((SimpleUploadedFile('products.csv', data), self.temporary_upload(data),
+                               SimpleUploadedFile('products.csv', data))):
+            with self.subTest(upload=type(f).__name__), \
+                    mock.patch.object(views, 'os', wraps=os) as views_os:
+                filepath = views._store_upload(f, f'job{n}')
+                with open(filepath, 'rb') as stored:
+                    self.assertEqual(stored.read(), data)
+                self.assertEqual(os.listdir(self.tmpdir), [os.path.basename(filepath)])
+                self.assertEqual(views_os.replace.call_count, 1 if n == 0 else 0)
+
+    def test_temporary_upload_lands_on_part_name_before_digest_name(self):
+        f = self.temporary_upload(b'sku,name\nA1,Apple\n')
+        part_path = os.path.join(self.tmpdir, 'job1.part')
+        with mock.patch.object(views, 'file_move_safe', wraps=views.file_move_safe) as move:
+            filepath = views._store_upload(f, 'job1')
+        move.assert_called_once_with(f.temporary_file_path(), part_path, allow_overwrite=True)
+        self.assertFalse(os.path.exists(part_path))
+        self.assertTrue(os.path.exists(filepath))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ProductWebhookDispatchTests(TransactionTestCase):
+    """
+    Outside a transaction (autocommit) on_commit runs the dispatch inside the request itself.
+    """
+
+    def test_broker_outage_still_redirects_after_save(self):
+        product = Product.objects.create(sku='abc', name='Old')
+        requests = (
+            (reverse('products:product_create'), {'sku': 'X1', 'name': 'New', 'description': ''}),
+            (reverse('products:product_edit', args=[product.pk]), {'sku': 'abc', 'name': 'Renamed', 'description': ''}),
+        )
+        with mock.patch.object(views.dispatch_webhooks_task, 'delay', side_effect=ConnectionError('broker down')) as delay, \
+                self.assertLogs('django.db.backends.base', 'ERROR'):
+            for url, data in requests:
+                with self.subTest(url=url):
+                    self.assertRedirects(self.client.post(url, data), reverse('products:product_list'),
+                                         fetch_redirect_response=False)
+
+        self.assertEqual(delay.call_count, 2)
+        self.assertEqual(sorted(Product.objects.values_list('sku', 'name')), [('X1', 'New'), ('abc', 'Renamed')])
+
+
+class JobStreamTests(SimpleTestCase):
+
+    def test_unknown_job_sends_one_snapshot_and_closes(self):
+        pubsub = mock.AsyncMock()
+        redis = mock.AsyncMock(hgetall=mock.AsyncMock(return_value={}))  # expired or never existed
+        with mock.patch.object(views, 'get_async_pubsub', return_value=pubsub), \
+                mock.patch.object(views, 'get_async_redis', return_value=redis):
+            response = async_to_sync(views.job_stream)(RequestFactory().get('/'), 'gone')
+            chunks = async_to_sync(self.consume)(response)
+
+        self.assertEqual(chunks, [b'data: {"status": "unknown", "progress": 0, "message": ""}\n\n'])
+        pubsub.get_message.assert_not_called()
+        pubsub.reset.assert_awaited_once()
+
+    @staticmethod
+    async def consume(response):
+        return [chunk async for chunk in response.streaming_content]
+
+
+class ParseCursorTests(SimpleTestCase):
+
+    def test_valid_cursor(self):
+        updated_at, pk = _parse_cursor('2024-01-02T03:04:05.123456+00:00|42')
+        self.assertEqual(pk, 42)
+        self.assertEqual((updated_at.year, updated_at.microsecond, updated_at.tzinfo), (2024, 123456, dt_timezone.utc))
+
+    def test_missing_or_malformed_cursor(self):
+        for after in ('', 'garbage', '2024-01-02T03:04:05|x', '2024-13-45T00:00:00|1', '|1'):
+            with self.subTest(after=after):
+                self.assertIsNone(_parse_cursor(after))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ProductListCacheKeyTests(SimpleTestCase):
+
+    def test_invalidation_changes_every_key(self):
+        key = product_list_key('q', 'true', 1)
+        self.assertEqual(product_list_key('q', 'true', 1), key)
+        self.assertNotEqual(product_list_key('q', 'true', 2), key)
+        invalidate_product_list()
+        self.assertNotEqual(product_list_key('q', 'true', 1), key)
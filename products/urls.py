@@ -7,7 +7,9 @@ urlpatterns = [
     path('', views.index, name='index'),
     path('upload/', views.upload_file, name='upload_file'),
     path('job-status/<str:job_id>/', views.job_status, name='job_status'),
+    path('job-stream/<str:job_id>/', views.job_stream, name='job_stream'),
     path('products/list/', views.product_list, name='product_list'),
+    path('products/export/', views.product_export, name='product_export'),
     path('products/create/', views.product_create, name='product_create'),
     path('products/edit/<int:pk>/', views.product_edit, name='product_edit'),
     path('products/delete/<int:pk>/', views.product_delete, name='product_delete'),
@@ -1,20 +1,74 @@
 import os
+import csv
+import json
+import hashlib
+import time
 import uuid
-import redis
 import logging
+from functools import lru_cache
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.move import file_move_safe
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import connection, transaction
 from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 from django.views.decorators.http import require_POST
 from .forms import UploadFileForm, ProductForm, WebhookForm
 from .models import Product, Webhook
-from .tasks import import_products_task, test_webhook_task, _trigger_webhooks
+from .tasks import JOB_TTL, import_products_task, test_webhook_task, dispatch_webhooks_task
+from .redis_client import get_async_pubsub, get_async_redis, get_redis
+from .cache import PRODUCT_LIST_TTL, invalidate_product_list, product_list_key
 
 # Redis connection for job progress
-_r = redis.from_url(settings.REDIS_URL, decode_responses=True)
+_r = get_redis()
 logger = logging.getLogger(__name__)
 
+# created once at import instead of a makedirs per upload
+UPLOAD_DIR = os.path.join(settings.MEDIA_ROOT or 'media', 'uploads')
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB reads/writes when copying in-memory uploads to disk
+JOB_STREAM_MAX_SECONDS = 300  # each job_stream response holds a pub/sub Redis connection, so cap it
+JOB_STREAM_KEEPALIVE_SECONDS = 15
+JOB_FINAL_STATUSES = ('complete', 'failed', 'unknown')  # 'unknown': the job hash expired or never existed
+EXPORT_COLUMNS = ('sku', 'name', 'description', 'active', 'updated_at')  # import columns first, so exports re-import
+EXPORT_CHUNK_SIZE = 2000
+
+
+# Create a retry job hash from an existing job's filepath, returns the filepath or nil if the old job is gone
+_retry_job_script = _r.register_script("""
+local filepath = redis.call('HGET', KEYS[1], 'filepath')
+if not filepath then
+    return nil
+end
+redis.call('HSET', KEYS[2],
+    'status', 'queued', 'progress', 0, 'message', ARGV[1], 'processed', 0, 'filepath', filepath)
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return filepath
+""")
+
+
+def _init_job(job_id, filepath, message):
+    """
+    Initialize the job:{job_id} hash polled by the UI with a JOB_TTL expiry, in a single pipelined round-trip.
+
+    :param job_id: job ID for progress tracking in Redis
+    :param filepath: uploaded CSV filepath, kept for retries
+    :param message: initial status message
+    """
+    with _r.pipeline(transaction=False) as p:
+        p.hset(f"job:{job_id}", mapping={
+            'status': "queued",
+            'progress': 0,
+            'message': message,
+            'processed': 0,
+            'filepath': filepath,
+        })
+        p.expire(f"job:{job_id}", JOB_TTL)
+        p.execute()
+
 
 def index(request):
     """
@@ -24,6 +78,41 @@ def index(request):
     return render(request, 'products/index.html', {'form': form})
 
 
+def _store_upload(f, job_id):
+    """
+    Save an uploaded CSV under UPLOAD_DIR, named by the BLAKE2b digest of its content,
+    so re-uploading the same file reuses the copy already on disk instead of writing another.
+
+    :param f: UploadedFile from the form
+    :param job_id: job ID, names the in-progress file until the digest is known
+    :returns: filepath of the stored CSV
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    part_path = os.path.join(UPLOAD_DIR, f"{job_id}.part")
+    if isinstance(f, TemporaryUploadedFile):
+        # large uploads are already on disk, hash them in place and move (rename) instead of copying
+        for chunk in f.chunks(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+        filepath = os.path.join(UPLOAD_DIR, f"{digest.hexdigest()}.csv")
+        if os.path.exists(filepath):
+            return filepath  # duplicate, Django deletes its own temporary upload file
+        # a move across devices copies chunk by chunk, so land it on the .part name first
+        file_move_safe(f.temporary_file_path(), part_path, allow_overwrite=True)
+    else:
+        with open(part_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as dest:
+            for chunk in f.chunks(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                dest.write(chunk)
+        filepath = os.path.join(UPLOAD_DIR, f"{digest.hexdigest()}.csv")
+        if os.path.exists(filepath):
+            os.remove(part_path)  # duplicate, drop our copy
+            return filepath
+
+    # atomic within UPLOAD_DIR, a concurrent duplicate upload never sees a partial file
+    os.replace(part_path, filepath)
+    return filepath
+
+
 def upload_file(request):
     """
     Handle CSV file upload, save to disk, initialize Redis job,
@@ -35,20 +124,11 @@ def upload_file(request):
             try:
                 f = form.cleaned_data['file']
                 # Saving csv to media folder
-                job_id = str(uuid.uuid4())
-                upload_dir = os.path.join(settings.MEDIA_ROOT or 'media', 'uploads')
-                os.makedirs(upload_dir, exist_ok=True)
-                filepath = os.path.join(upload_dir, f"{job_id}.csv")
-                with open(filepath, 'wb') as dest:
-                    for chunk in f.chunks():
-                        dest.write(chunk)
+                job_id = uuid.uuid4().hex
+                filepath = _store_upload(f, job_id)
 
                 # init Redis progress & save filepath for retry
-                _r.set(f"job:{job_id}:status", "queued")
-                _r.set(f"job:{job_id}:progress", 0)
-                _r.set(f"job:{job_id}:message", "Queued")
-                _r.set(f"job:{job_id}:processed", 0)
-                _r.set(f"job:{job_id}:filepath", filepath)
+                _init_job(job_id, filepath, "Queued")
 
                 # enqueue async task
                 import_products_task.delay(filepath, job_id)
@@ -60,20 +140,59 @@ def upload_file(request):
     return JsonResponse({'error': 'invalid'}, status=400)
 
 
-def job_status(request, job_id):
+async def _job_snapshot(job_id):
+    """
+    Read the job:{job_id} hash in a single HGETALL and shape it for the UI.
+    """
+    job = await get_async_redis().hgetall(f"job:{job_id}")
+    return {
+        'status': job.get('status') or 'unknown',
+        'progress': int(job.get('progress') or 0),
+        'message': job.get('message') or '',
+    }
+
+
+async def job_status(request, job_id):
     """
     Return JSON with current progress and status of job.
     """
     try:
-        status = _r.get(f"job:{job_id}:status") or 'unknown'
-        progress = int(_r.get(f"job:{job_id}:progress") or 0)
-        msg = _r.get(f"job:{job_id}:message") or ''
-        return JsonResponse({'status': status, 'progress': progress, 'message': msg})
+        return JsonResponse(await _job_snapshot(job_id))
     except Exception as e:
         logger.exception(f"Error fetching job status for {job_id}")
         return JsonResponse({'error': str(e)}, status=500)
 
 
+async def job_stream(request, job_id):
+    """
+    Stream job progress as Server-Sent Events.
+    Sends the current snapshot, then a fresh one every time the tasks publish on
+    job:{job_id}:events, until the job completes/fails/turns out unknown or JOB_STREAM_MAX_SECONDS
+    pass (the browser's EventSource reconnects by itself, the page closes it on a final status).
+    """
+    async def events():
+        pubsub = get_async_pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(f"job:{job_id}:events")
+        try:
+            # subscribe before the first read so no update between the two is lost
+            deadline = time.monotonic() + JOB_STREAM_MAX_SECONDS
+            snapshot = await _job_snapshot(job_id)
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            while snapshot['status'] not in JOB_FINAL_STATUSES and time.monotonic() < deadline:
+                if await pubsub.get_message(timeout=JOB_STREAM_KEEPALIVE_SECONDS) is None:
+                    yield ": keepalive\n\n"
+                    continue
+                snapshot = await _job_snapshot(job_id)
+                yield f"data: {json.dumps(snapshot)}\n\n"
+        finally:
+            await pubsub.reset()
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @require_POST
 def retry_import(request, job_id):
     """
@@ -81,19 +200,15 @@ def retry_import(request, job_id):
     Returns new_job_id.
     """
     try:
-        # Getting filepath from redis stored location of local directory (media)
-        filepath = _r.get(f"job:{job_id}:filepath")
+        # Creating new job id and publishing to redis so UI can poll this, the script copies the
+        # filepath from the old job into the new one atomically, in a single round-trip
+        new_job_id = uuid.uuid4().hex
+        filepath = _retry_job_script(keys=[f"job:{job_id}", f"job:{new_job_id}"], args=["Queued (retry)", JOB_TTL])
         if not filepath or not os.path.exists(filepath):
+            if filepath:
+                _r.delete(f"job:{new_job_id}")
             return JsonResponse({'error': 'original file not found'}, status=400)
 
-        # Creating new job id and publishing to redis so UI can poll this
-        new_job_id = str(uuid.uuid4())
-        _r.set(f"job:{new_job_id}:status", "queued")
-        _r.set(f"job:{new_job_id}:progress", 0)
-        _r.set(f"job:{new_job_id}:message", "Queued (retry)")
-        _r.set(f"job:{new_job_id}:processed", 0)
-        _r.set(f"job:{new_job_id}:filepath", filepath)
-
         # starting processing task as usual
         import_products_task.delay(filepath, new_job_id)
         logger.info(f"Retrying job {job_id} as new job {new_job_id}")
@@ -103,6 +218,41 @@ def retry_import(request, job_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@lru_cache(maxsize=2048)
+def _build_filter(q, active):
+    """
+    Build (and memoize, common searches repeat a lot) the Q for the product_list search box
+    and active filter. Q objects aren't mutated by filter(), so sharing them is safe.
+    """
+    f = Q()
+    if q:
+        # substring search, served on Postgres by the pg_trgm GIN indexes from migration 0002
+        f &= Q(sku__icontains=q) | Q(name__icontains=q) | Q(description__icontains=q)
+    if active in ('true', 'false'):
+        f &= Q(active=(active == 'true'))
+    return f
+
+
+def _filter_products(q, active):
+    """
+    Products matching the product_list search box and active filter.
+    """
+    return Product.objects.filter(_build_filter(q, active.lower()))
+
+
+def _parse_cursor(after):
+    """
+    Parse a product_list "after" cursor ("<updated_at iso>|<id>" of the last row shown).
+    Returns (updated_at, id), or None when missing or malformed.
+    """
+    updated_at, _, pk = after.rpartition('|')
+    try:
+        updated_at = parse_datetime(updated_at)
+        return (updated_at, int(pk)) if updated_at else None
+    except ValueError:
+        return None
+
+
 def product_list(request):
     """
     List products with optional filtering and pagination.
@@ -110,35 +260,79 @@ def product_list(request):
     try:
         q = request.GET.get('q', '')
         active = request.GET.get('active', '')
-        qs = Product.objects.all()
-        if q:
-            qs = qs.filter(Q(sku__icontains=q) | Q(name__icontains=q) | Q(description__icontains=q))
-        if active.lower() in ['true', 'false']:
-            qs = qs.filter(active=(active.lower() == 'true'))
+        qs = _filter_products(q, active)
 
         # pagination logic
+        # fetch one extra row to know if there's a next page instead of a separate COUNT(*),
+        # and select only the columns the list template renders
         page = int(request.GET.get('page', 1))
         per_page = 25 # currently displaying 25 products per page, can adjust
-        total = qs.count()
-        start = (page-1)*per_page
-        end = start + per_page
-        products = qs.order_by('-updated_at')[start:end]
-        show_next = total > page * per_page
+        after = request.GET.get('after', '')
+        cursor = _parse_cursor(after)
+
+        def load_page():
+            ordered = qs.only('id', 'sku', 'name', 'active', 'updated_at').order_by('-updated_at', '-id')
+            if cursor:
+                # keyset pagination: seek past the last row of the previous page on the
+                # (updated_at, id) index instead of skipping OFFSET rows. The OR alone is only a
+                # filter to Postgres, the redundant updated_at <= ts is what bounds the index scan
+                updated_at, pk = cursor
+                rows = list(
+                    ordered.filter(updated_at__lte=updated_at)
+                    .filter(Q(updated_at__lt=updated_at) | Q(id__lt=pk))[:per_page + 1]
+                )
+            else:
+                start = (page-1)*per_page
+                rows = list(ordered[start:start + per_page + 1])
+            return rows[:per_page], len(rows) > per_page
+
+        # rendered HTML isn't cached since it carries the per-user CSRF token, only the page rows
+        products, show_next = cache.get_or_set(product_list_key(q, active, page, after), load_page, PRODUCT_LIST_TTL)
 
         return render(request, 'products/list.html', {
             'products': products,
             'page': page,
             'per_page': per_page,
-            'total': total,
             'q': q,
             'active': active,
-            'show_next': show_next
+            'show_next': show_next,
+            'next_after': f"{products[-1].updated_at.isoformat()}|{products[-1].pk}" if show_next else '',
         })
     except Exception as e:
         logger.exception("Error fetching product list")
         return JsonResponse({'error': str(e)}, status=500)
 
 
+class _Echo:
+    """
+    Pseudo file for csv.writer that hands each formatted row back instead of buffering it.
+    """
+    def write(self, value):
+        return value
+
+
+def product_export(request):
+    """
+    Export the products matching the product_list filters as a streamed CSV.
+    Rows are fetched EXPORT_CHUNK_SIZE at a time, so memory stays flat whatever the table size.
+    """
+    qs = _filter_products(request.GET.get('q', ''), request.GET.get('active', ''))
+    # named=True: the plain values_list iterable runs its query eagerly, which aiterator() can't do
+    # from the event loop, the namedtuple one is a lazy generator (and still writes as a plain row)
+    rows = qs.order_by('id').values_list(*EXPORT_COLUMNS, named=True)
+    writer = csv.writer(_Echo())
+
+    # async generator: under ASGI Django would buffer a sync iterator whole before sending it
+    async def stream():
+        yield writer.writerow(EXPORT_COLUMNS)
+        async for row in rows.aiterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(stream(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="products.csv"'
+    return response
+
+
 def product_create(request):
     """
     Create a new product from form submission.
@@ -149,8 +343,10 @@ def product_create(request):
             form = ProductForm(request.POST)
             if form.is_valid():
                 product = form.save()
-                # calling webhook if exists for post-create
-                _trigger_webhooks('product_created', {'id': product.id, 'name': product.name})
+                # calling webhook if exists for post-create, enqueued once the row is committed; robust so a
+                # broker outage is logged instead of failing a request whose write already landed
+                payload = {'id': product.id, 'name': product.name}
+                transaction.on_commit(lambda: dispatch_webhooks_task.delay('product_created', payload), robust=True)
                 logger.info(f"Product created: {product.sku}")
                 return redirect('products:product_list')
         else:
@@ -165,14 +361,17 @@ def product_edit(request, pk):
     """
     Edit existing product.
     """
-    product = get_object_or_404(Product, pk=pk)
+    # load just the form's columns; updated_at must stay loaded, save() only writes the loaded fields
+    product = get_object_or_404(Product.objects.only('id', *ProductForm.Meta.fields, 'updated_at'), pk=pk)
     try:
         if request.method == 'POST':
             form = ProductForm(request.POST, instance=product)
             if form.is_valid():
                 form.save()
-                # calling webhook if exists for post-update
-                _trigger_webhooks('product_updated', {'id': product.id, 'name': product.name})
+                # calling webhook if exists for post-update, enqueued once the row is committed; robust so a
+                # broker outage is logged instead of failing a request whose write already landed
+                payload = {'id': product.id, 'name': product.name}
+                transaction.on_commit(lambda: dispatch_webhooks_task.delay('product_updated', payload), robust=True)
                 logger.info(f"Product updated: {product.sku}")
                 return redirect('products:product_list')
         else:
@@ -187,7 +386,8 @@ def product_delete(request, pk):
     """
     Delete a single product.
     """
-    product = get_object_or_404(Product, pk=pk)
+    # the confirm page only renders str(product)
+    product = get_object_or_404(Product.objects.only('id', 'sku', 'name'), pk=pk)
     try:
         if request.method == 'POST':
             product.delete()
@@ -202,10 +402,20 @@ def product_delete(request, pk):
 def product_delete_all(request):
     """
     Delete all products.
+    Uses TRUNCATE on Postgres (a raw DELETE elsewhere) instead of the ORM's per-row collector,
+    so post_delete signals do NOT fire for the removed products.
     """
     try:
         if request.method == 'POST':
-            Product.objects.all().delete()
+            if not request.user.has_perm('products.delete_product'):
+                return JsonResponse({'error': 'forbidden'}, status=403)
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    with connection.cursor() as cursor:
+                        cursor.execute(f'TRUNCATE TABLE {Product._meta.db_table} RESTART IDENTITY CASCADE')
+                else:
+                    Product.objects.all()._raw_delete(connection.alias)
+            invalidate_product_list()  # no post_delete to do it for us
             logger.info("All products deleted")
             return JsonResponse({'status': 'ok'})
         return JsonResponse({'error': 'method'}, status=400)
@@ -227,8 +437,21 @@ def webhooks(request):
                 return redirect('products:webhooks')
         else:
             form = WebhookForm()
-        hooks = Webhook.objects.all()
-        return render(request, 'products/webhooks.html', {'form': form, 'hooks': hooks})
+        # paginated like product_list: one extra row instead of a COUNT(*), only the rendered columns
+        page = int(request.GET.get('page', 1))
+        per_page = 50
+        start = (page-1)*per_page
+        hooks = list(
+            Webhook.objects.only('id', 'url', 'event_type', 'is_enabled', 'last_test_status')
+            .order_by('-id')[start:start + per_page + 1]
+        )
+        show_next = len(hooks) > per_page
+        return render(request, 'products/webhooks.html', {
+            'form': form,
+            'hooks': hooks[:per_page],
+            'page': page,
+            'show_next': show_next,
+        })
     except Exception as e:
         logger.exception("Error handling webhooks page")
         return JsonResponse({'error': str(e)}, status=500)